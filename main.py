@@ -2,8 +2,10 @@ import sys
 import math
 import random
 import pygame
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+from itertools import islice
+from typing import Callable, Deque, Iterable, List, Tuple, Dict, Optional
 
 # =============================
 # TETRIS CONFIGURATION CONSTANTS
@@ -14,6 +16,17 @@ COLUMNS = 10
 ROWS = 20
 SIDE_PANEL_WIDTH = 6  # columns width for side panel rendering
 FPS = 60
+MAX_GRAVITY_STEPS = 2  # Max rows gravity may catch up in a single frame
+
+# Control hints shown at the bottom of the side panel
+CONTROLS = [
+    "←/→: Move",
+    "↑/Z/X: Rotate",
+    "↓: Soft drop",
+    "Space: Hard drop",
+    "C: Hold",
+    "Esc: Quit",
+]
 
 # Gravity speeds (in seconds per row) per level, roughly following NES pace but simplified
 LEVEL_SPEEDS = [
@@ -41,7 +54,7 @@ COLORS = {
 
 # Tetromino rotation states (0..3) with 4x4 matrices
 # Using right-handed (clockwise) rotation. Shapes are defined in state 0.
-TETROMINO_SHAPES: Dict[str, List[List[Tuple[int, int]]]] = {}
+TETROMINO_SHAPES: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]] = {}
 
 # Helper to construct shape from 4x4 strings into cell coordinate lists per rotation
 
@@ -110,10 +123,55 @@ for name, grid in SHAPE_DEFS.items():
     states = []
     cur = base
     for r in range(4):
-        states.append(cur)
+        states.append(tuple(cur))
         # rotate each cell
         cur = [rotate_point(x, y) for (x, y) in cur]
-    TETROMINO_SHAPES[name] = states
+    TETROMINO_SHAPES[name] = tuple(states)
+
+# Lowest cell per occupied column for each rotation state, as (cx, max_cy) pairs.
+# Every tetromino column is a contiguous run, so only these cells can hit the stack on a drop.
+PIECE_BOTTOMS: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]] = {
+    name: tuple(
+        tuple(sorted({cx: max(cy for x, cy in shape if x == cx) for cx, _ in shape}.items()))
+        for shape in states
+    )
+    for name, states in TETROMINO_SHAPES.items()
+}
+
+# Bounding box per rotation state: (min_x, max_x, min_y, max_y, width, height)
+
+def shape_bbox(shape: Tuple[Tuple[int, int], ...]) -> Tuple[int, int, int, int, int, int]:
+    min_x = min(cx for cx, _ in shape)
+    max_x = max(cx for cx, _ in shape)
+    min_y = min(cy for _, cy in shape)
+    max_y = max(cy for _, cy in shape)
+    return (min_x, max_x, min_y, max_y, max_x - min_x + 1, max_y - min_y + 1)
+
+PIECE_BBOX: Dict[str, Tuple[Tuple[int, int, int, int, int, int], ...]] = {
+    name: tuple(shape_bbox(shape) for shape in states)
+    for name, states in TETROMINO_SHAPES.items()
+}
+
+# Column extent (min_cx, max_cx) per rotation state, for wall checks
+PIECE_X_EXTENT: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    name: tuple((box[0], box[1]) for box in boxes) for name, boxes in PIECE_BBOX.items()
+}
+
+# Occupancy per shape row as (cy, bitmask) pairs, bit 0 being the shape's leftmost column (min_cx)
+PIECE_ROW_MASKS: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]] = {
+    name: tuple(
+        tuple(sorted(
+            {cy: sum(1 << (cx - min_cx) for cx, y in shape if y == cy) for _, cy in shape}.items()
+        ))
+        for shape, (min_cx, _) in zip(states, PIECE_X_EXTENT[name])
+    )
+    for name, states in TETROMINO_SHAPES.items()
+}
+
+# Board cells store a small color index instead of a color tuple:
+# 0 = empty, 1..7 = piece kinds in SHAPE_DEFS order. PALETTE maps it back.
+KIND_INDEX: Dict[str, int] = {name: i + 1 for i, name in enumerate(SHAPE_DEFS)}
+PALETTE: Tuple[Optional[Tuple[int, int, int]], ...] = (None,) + tuple(COLORS[name] for name in SHAPE_DEFS)
 
 # Super simple wall-kick data (not full SRS), but good enough for robust play
 # Order of kicks to try when rotating CW or CCW
@@ -122,7 +180,7 @@ WALL_KICKS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Piece:
     kind: str
     x: int
@@ -133,27 +191,29 @@ class Piece:
     def color(self) -> Tuple[int, int, int]:
         return COLORS[self.kind]
 
-    def cells(self, rot: Optional[int] = None) -> List[Tuple[int, int]]:
-        r = self.rotation if rot is None else rot % 4
-        return [(self.x + cx, self.y + cy) for (cx, cy) in TETROMINO_SHAPES[self.kind][r]]
-
-    def rotated(self, dr: int) -> 'Piece':
-        return Piece(self.kind, self.x, self.y, (self.rotation + dr) % 4)
+    @property
+    def shape(self) -> Tuple[Tuple[int, int], ...]:
+        # Shared (cx, cy) offsets for the current rotation; add x/y for board coordinates
+        return TETROMINO_SHAPES[self.kind][self.rotation]
 
 
 class Board:
     def __init__(self, cols: int = COLUMNS, rows: int = ROWS):
         self.cols = cols
         self.rows = rows
-        # grid[y][x] -> None or color tuple
-        self.grid: List[List[Optional[Tuple[int, int, int]]]] = [
-            [None for _ in range(cols)] for _ in range(rows)
-        ]
+        # Flat row-major grid: grid[y * cols + x] -> 0 (empty) or KIND_INDEX value
+        self.grid = bytearray(cols * rows)
+        # column_tops[x] -> y of the highest filled cell in column x (rows if empty)
+        self.column_tops: List[int] = [rows] * cols
+        # row_masks[y] -> occupancy of row y, bit x set when grid cell (x, y) is filled
+        self.row_masks: List[int] = [0] * rows
+        # Set whenever locked cells change so the renderer knows to repaint its cached board
+        self.dirty: bool = True
         self.current: Optional[Piece] = None
         self.hold: Optional[str] = None
         self.can_hold: bool = True
         self.bag: List[str] = []
-        self.next_queue: List[str] = []
+        self.next_queue: Deque[str] = deque()
         self.score: int = 0
         self.lines_cleared: int = 0
         self.level: int = 1
@@ -175,7 +235,7 @@ class Board:
     def spawn(self):
         if not self.next_queue:
             self.next_queue.append(self._next_from_bag())
-        kind = self.next_queue.pop(0)
+        kind = self.next_queue.popleft()
         self.next_queue.append(self._next_from_bag())
         # Spawn near top center
         spawn_x = self.cols // 2 - 2
@@ -205,38 +265,44 @@ class Board:
         self.can_hold = False
 
     # ---------- Validation and Movement ----------
-    def _in_bounds(self, x: int, y: int) -> bool:
-        return 0 <= x < self.cols and y < self.rows
-
     def _valid(self, piece: Piece) -> bool:
-        for (x, y) in piece.cells():
+        return self._valid_at(piece.kind, piece.rotation, piece.x, piece.y)
+
+    def _valid_at(self, kind: str, rot: int, px: int, py: int) -> bool:
+        # Same check as _valid, on raw values so callers can probe positions without building a Piece
+        min_cx, max_cx = PIECE_X_EXTENT[kind][rot]
+        shift = px + min_cx
+        if shift < 0 or px + max_cx >= self.cols:
+            return False
+        for (cy, mask) in PIECE_ROW_MASKS[kind][rot]:
+            y = py + cy
             if y < 0:
                 # allow spawn above visible board
-                if not (0 <= x < self.cols):
-                    return False
                 continue
-            if not self._in_bounds(x, y) or self.grid[y][x] is not None:
+            if y >= self.rows or self.row_masks[y] & (mask << shift):
                 return False
         return True
 
     def try_move(self, dx: int, dy: int) -> bool:
         if not self.current:
             return False
-        moved = Piece(self.current.kind, self.current.x + dx, self.current.y + dy, self.current.rotation)
-        if self._valid(moved):
-            self.current = moved
+        cur = self.current
+        x, y = cur.x + dx, cur.y + dy
+        if self._valid_at(cur.kind, cur.rotation, x, y):
+            self.current = Piece(cur.kind, x, y, cur.rotation)
             return True
         return False
 
     def try_rotate(self, dr: int) -> bool:
         if not self.current:
             return False
-        rotated = self.current.rotated(dr)
+        cur = self.current
+        rot = (cur.rotation + dr) % 4
         # Try wall kicks
         for (kx, ky) in WALL_KICKS:
-            candidate = Piece(rotated.kind, rotated.x + kx, rotated.y + ky, rotated.rotation)
-            if self._valid(candidate):
-                self.current = candidate
+            x, y = cur.x + kx, cur.y + ky
+            if self._valid_at(cur.kind, rot, x, y):
+                self.current = Piece(cur.kind, x, y, rot)
                 return True
         return False
 
@@ -244,15 +310,22 @@ class Board:
     def hard_drop_distance(self) -> int:
         if not self.current:
             return 0
-        dist = 0
-        tmp = Piece(self.current.kind, self.current.x, self.current.y, self.current.rotation)
-        while True:
-            nxt = Piece(tmp.kind, tmp.x, tmp.y + 1, tmp.rotation)
-            if self._valid(nxt):
-                tmp = nxt
-                dist += 1
-            else:
-                break
+        px, py = self.current.x, self.current.y
+        cols = self.cols
+        dist = self.rows
+        for (cx, cy) in PIECE_BOTTOMS[self.current.kind][self.current.rotation]:
+            x = px + cx
+            start = py + cy + 1
+            top = self.column_tops[x]
+            if start <= top:
+                # Above the stack: everything down to the column top is empty
+                dist = min(dist, top - start)
+                continue
+            # Tucked under an overhang: scan down to the first filled cell or the floor
+            y = start
+            while y < self.rows and not self.grid[y * cols + x]:
+                y += 1
+            dist = min(dist, y - start)
         return dist
 
     def hard_drop(self):
@@ -273,24 +346,60 @@ class Board:
     def lock_piece(self):
         if not self.current:
             return
-        for (x, y) in self.current.cells():
+        color_idx = KIND_INDEX[self.current.kind]
+        px, py = self.current.x, self.current.y
+        for (cx, cy) in self.current.shape:
+            x = px + cx
+            y = py + cy
             if y < 0:
                 # Locked above board -> game over
                 self.game_over = True
                 continue
-            self.grid[y][x] = self.current.color
+            self.grid[y * self.cols + x] = color_idx
+            self.row_masks[y] |= 1 << x
+            self.column_tops[x] = min(self.column_tops[x], y)
+        self.dirty = True
         self.current = None
         self._clear_lines_efficient()
         self.spawn()
 
     def _clear_lines_efficient(self):
-        # Keep rows that are not full; count cleared lines, then add empty rows at top.
-        new_grid = [row for row in self.grid if any(cell is None for cell in row)]
-        cleared = self.rows - len(new_grid)
-        if cleared > 0:
-            empty_rows = [[None for _ in range(self.cols)] for _ in range(cleared)]
-            self.grid = empty_rows + new_grid
-            self._apply_scoring(cleared)
+        cols = self.cols
+        full = (1 << cols) - 1
+        masks = self.row_masks
+        if full not in masks:
+            return
+        # Compact in place: copy each non-full row down to the next free slot (bottom-up),
+        # then zero the rows left over at the top.
+        grid = self.grid
+        write = self.rows - 1
+        for y in range(self.rows - 1, -1, -1):
+            if masks[y] != full:
+                if write != y:
+                    masks[write] = masks[y]
+                    grid[write * cols:(write + 1) * cols] = grid[y * cols:(y + 1) * cols]
+                write -= 1
+        cleared = write + 1
+        masks[:cleared] = [0] * cleared
+        grid[:cleared * cols] = bytes(cleared * cols)
+        self._recompute_column_tops()
+        self._apply_scoring(cleared)
+
+    def _recompute_column_tops(self):
+        tops = [self.rows] * self.cols
+        full = (1 << self.cols) - 1
+        seen = 0
+        # Walk top-down over the row masks; each column's first set bit is its top
+        for y, mask in enumerate(self.row_masks):
+            new = mask & ~seen
+            while new:
+                low = new & -new
+                tops[low.bit_length() - 1] = y
+                new ^= low
+            seen |= mask
+            if seen == full:
+                break
+        self.column_tops = tops
 
     def _apply_scoring(self, cleared: int):
         # Simple Tetris scoring
@@ -299,13 +408,6 @@ class Board:
         self.lines_cleared += cleared
         self.level = 1 + self.lines_cleared // 10
 
-    # ---------- Ghost Piece ----------
-    def ghost_cells(self) -> List[Tuple[int, int]]:
-        if not self.current:
-            return []
-        dist = self.hard_drop_distance()
-        return [(x, y + dist) for (x, y) in self.current.cells()]
-
 
 class Game:
     def __init__(self):
@@ -315,6 +417,9 @@ class Game:
         self.height = ROWS * CELL_SIZE
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption(WINDOW_TITLE)
+        # Only queue the events handle_input reads; held keys are polled via key.get_pressed()
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font_small = pygame.font.SysFont("consolas", 18)
         self.font_medium = pygame.font.SysFont("consolas", 22)
@@ -322,38 +427,120 @@ class Game:
         self.board = Board(COLUMNS, ROWS)
         self.board.spawn()
         self.time_since_gravity = 0.0
+        # KEYDOWN key -> board action
+        self._keydown_actions: Dict[int, Callable[[Board], object]] = {
+            pygame.K_LEFT: lambda b: b.try_move(-1, 0),
+            pygame.K_RIGHT: lambda b: b.try_move(1, 0),
+            pygame.K_DOWN: lambda b: b.soft_drop(),
+            pygame.K_UP: lambda b: b.try_rotate(1),  # CW
+            pygame.K_x: lambda b: b.try_rotate(1),  # CW
+            pygame.K_z: lambda b: b.try_rotate(-1),  # CCW
+            pygame.K_SPACE: lambda b: b.hard_drop(),
+            pygame.K_c: lambda b: b.hold_piece(),
+        }
+        # One pre-rendered cell per piece color (border baked in) so the board
+        # can be drawn with a single batched blits() call
+        self._cell_surfs: Dict[Tuple[int, int, int], pygame.Surface] = {
+            color: self._make_cell_surface(color) for color in COLORS.values()
+        }
+        # Translucent ghost cell, built once instead of once per drawn cell
+        self._ghost_surf = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA).convert_alpha()
+        self._ghost_surf.fill((*GHOST, 100))
+        pygame.draw.rect(self._ghost_surf, BORDER, self._ghost_surf.get_rect(), 1)
+        # Playfield with the locked cells, repainted only when the board is dirty
+        self._board_surface = pygame.Surface((COLUMNS * CELL_SIZE, ROWS * CELL_SIZE)).convert()
+        # Next/hold previews, one per piece kind
+        self._preview_surfs: Dict[str, pygame.Surface] = {
+            kind: self._make_preview_surface(kind) for kind in SHAPE_DEFS
+        }
+        # Side panel text that never changes is rendered once
+        self._static_text: Dict[str, pygame.Surface] = {
+            "title": self.font_big.render("TETRIS", True, WHITE).convert_alpha(),
+            "game_over": self.font_big.render("GAME OVER", True, WHITE).convert_alpha(),
+            "quit_hint": self.font_medium.render("Press ESC to quit", True, LIGHT).convert_alpha(),
+        }
+        for label in ("Score", "Level", "Lines", "Next", "Hold"):
+            self._static_text[label] = self.font_medium.render(label + ":", True, LIGHT).convert_alpha()
+        self._controls_text = [self.font_small.render(c, True, LIGHT).convert_alpha() for c in CONTROLS]
+        self._game_over_overlay = pygame.Surface(
+            (COLUMNS * CELL_SIZE, ROWS * CELL_SIZE), pygame.SRCALPHA
+        ).convert_alpha()
+        self._game_over_overlay.fill((20, 20, 24, 170))
+        # label -> (value, rendered value) for the score/level/lines readouts
+        self._stat_text: Dict[str, Tuple[int, pygame.Surface]] = {}
 
     # ---------- Rendering ----------
-    def draw_cell(self, x: int, y: int, color: Tuple[int, int, int], alpha: int = 255):
-        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-        if alpha == 255:
-            pygame.draw.rect(self.screen, color, rect)
-        else:
-            surface = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-            surface.fill((*color, alpha))
-            self.screen.blit(surface, rect.topleft)
-        pygame.draw.rect(self.screen, BORDER, rect, 1)
+    def _make_cell_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        surface = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+        surface.fill(color)
+        pygame.draw.rect(surface, BORDER, surface.get_rect(), 1)
+        return surface
 
-    def render_board(self):
+    def _repaint_board_surface(self):
         # Background
-        playfield_rect = pygame.Rect(0, 0, COLUMNS * CELL_SIZE, ROWS * CELL_SIZE)
-        self.screen.fill(GRAY, playfield_rect)
-        # Locked cells
-        for y in range(self.board.rows):
-            for x in range(self.board.cols):
-                color = self.board.grid[y][x]
-                if color is not None:
-                    self.draw_cell(x, y, color)
+        self._board_surface.fill(GRAY)
+        # Locked cells (lookups hoisted to locals for the per-cell loop)
+        blits = []
+        append = blits.append
+        cols = self.board.cols
+        cell_surfs = self._cell_surfs
+        palette = PALETTE
+        cs = CELL_SIZE
+        for i, idx in enumerate(self.board.grid):
+            if idx:
+                y, x = divmod(i, cols)
+                append((cell_surfs[palette[idx]], (x * cs, y * cs)))
+        self._board_surface.blits(blits, doreturn=0)
+        self.board.dirty = False
+
+    def _make_preview_surface(self, kind: str) -> pygame.Surface:
+        # Draw on a small 4x3 area
+        preview_surface = pygame.Surface((4 * CELL_SIZE, 3 * CELL_SIZE), pygame.SRCALPHA).convert_alpha()
+        preview_surface.fill((0, 0, 0, 0))
+        cell_surf = self._cell_surfs[COLORS[kind]]
+        # Place piece centered in preview
+        cells = TETROMINO_SHAPES[kind][0]
+        min_x, _, min_y, _, width, height = PIECE_BBOX[kind][0]
+        offset_x = (4 - width) // 2 - min_x
+        offset_y = (3 - height) // 2 - min_y
+        preview_surface.blits(
+            [(cell_surf, ((cx + offset_x) * CELL_SIZE, (cy + offset_y) * CELL_SIZE)) for (cx, cy) in cells],
+            doreturn=0,
+        )
+        return preview_surface
+
+    def render_board(self):
+        if self.board.dirty:
+            self._repaint_board_surface()
+        self.screen.blit(self._board_surface, (0, 0))
+        current = self.board.current
+        if not current:
+            return
+        blits = []
+        append = blits.append
+        cs = CELL_SIZE
+        shape = current.shape
+        px, py = current.x, current.y
         # Ghost piece
-        if self.board.current:
-            for (x, y) in self.board.ghost_cells():
-                if y >= 0:
-                    self.draw_cell(x, y, GHOST, alpha=100)
+        ghost_surf = self._ghost_surf
+        ghost_y = py + self.board.hard_drop_distance()
+        for (cx, cy) in shape:
+            if ghost_y + cy >= 0:
+                append((ghost_surf, ((px + cx) * cs, (ghost_y + cy) * cs)))
         # Current piece
-        if self.board.current:
-            for (x, y) in self.board.current.cells():
-                if y >= 0:
-                    self.draw_cell(x, y, self.board.current.color)
+        cell_surf = self._cell_surfs[current.color]
+        for (cx, cy) in shape:
+            if py + cy >= 0:
+                append((cell_surf, ((px + cx) * cs, (py + cy) * cs)))
+        self.screen.blits(blits, doreturn=0)
+
+    def _render_stat(self, label: str, value: int) -> pygame.Surface:
+        # Re-render a stat value only when it changes
+        cached = self._stat_text.get(label)
+        if cached is None or cached[0] != value:
+            cached = (value, self.font_medium.render(str(value), True, WHITE).convert_alpha())
+            self._stat_text[label] = cached
+        return cached[1]
 
     def render_panel(self):
         start_x = COLUMNS * CELL_SIZE
@@ -364,106 +551,65 @@ class Game:
         y = pad
 
         # Title
-        title = self.font_big.render("TETRIS", True, WHITE)
-        self.screen.blit(title, (x, y))
+        self.screen.blit(self._static_text["title"], (x, y))
         y += 50
 
         # Score/Level/Lines
         stats = [
-            ("Score", str(self.board.score)),
-            ("Level", str(self.board.level)),
-            ("Lines", str(self.board.lines_cleared)),
+            ("Score", self.board.score),
+            ("Level", self.board.level),
+            ("Lines", self.board.lines_cleared),
         ]
         for label, value in stats:
-            t1 = self.font_medium.render(label + ":", True, LIGHT)
-            t2 = self.font_medium.render(value, True, WHITE)
-            self.screen.blit(t1, (x, y))
-            self.screen.blit(t2, (x + 90, y))
+            self.screen.blit(self._static_text[label], (x, y))
+            self.screen.blit(self._render_stat(label, value), (x + 90, y))
             y += 28
 
         y += 10
         # Next queue preview
-        nxt_label = self.font_medium.render("Next:", True, LIGHT)
-        self.screen.blit(nxt_label, (x, y))
+        self.screen.blit(self._static_text["Next"], (x, y))
         y += 24
-        self.draw_preview_list(self.board.next_queue[:5], x, y)
+        self.draw_preview_list(islice(self.board.next_queue, 5), x, y)
 
         # Hold piece
         y += 5 * CELL_SIZE + 20
-        hold_label = self.font_medium.render("Hold:", True, LIGHT)
-        self.screen.blit(hold_label, (x, y))
+        self.screen.blit(self._static_text["Hold"], (x, y))
         y += 24
         if self.board.hold:
             self.draw_preview_piece(self.board.hold, x, y)
 
         # Controls
         y = self.height - 160
-        controls = [
-            "←/→: Move",
-            "↑/Z/X: Rotate",
-            "↓: Soft drop",
-            "Space: Hard drop",
-            "C: Hold",
-            "Esc: Quit",
-        ]
-        for c in controls:
-            t = self.font_small.render(c, True, LIGHT)
+        for t in self._controls_text:
             self.screen.blit(t, (x, y))
             y += 20
 
-    def draw_preview_list(self, kinds: List[str], x: int, y: int):
-        for i, k in enumerate(kinds):
-            self.draw_preview_piece(k, x, y + i * CELL_SIZE)
+    def draw_preview_list(self, kinds: Iterable[str], x: int, y: int):
+        self.screen.blits(
+            [(self._preview_surfs[k], (x, y + i * CELL_SIZE)) for i, k in enumerate(kinds)],
+            doreturn=0,
+        )
 
     def draw_preview_piece(self, kind: str, x: int, y: int):
-        # Draw on a small 4x3 area
-        preview_surface = pygame.Surface((4 * CELL_SIZE, 3 * CELL_SIZE), pygame.SRCALPHA)
-        preview_surface.fill((0, 0, 0, 0))
-        color = COLORS[kind]
-        # Place piece centered in preview
-        cells = TETROMINO_SHAPES[kind][0]
-        min_x = min(cx for cx, _ in cells)
-        max_x = max(cx for cx, _ in cells)
-        min_y = min(cy for _, cy in cells)
-        max_y = max(cy for _, cy in cells)
-        width = (max_x - min_x + 1)
-        height = (max_y - min_y + 1)
-        offset_x = (4 - width) // 2 - min_x
-        offset_y = (3 - height) // 2 - min_y
-        for (cx, cy) in cells:
-            rx = (cx + offset_x) * CELL_SIZE
-            ry = (cy + offset_y) * CELL_SIZE
-            rect = pygame.Rect(rx, ry, CELL_SIZE, CELL_SIZE)
-            pygame.draw.rect(preview_surface, color, rect)
-            pygame.draw.rect(preview_surface, BORDER, rect, 1)
-        self.screen.blit(preview_surface, (x, y))
+        self.screen.blit(self._preview_surfs[kind], (x, y))
 
     # ---------- Input & Update ----------
     def handle_input(self, dt: float):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        quit_type, keydown_type, escape_key = pygame.QUIT, pygame.KEYDOWN, pygame.K_ESCAPE
+        actions = self._keydown_actions
+        for event in pygame.event.get((quit_type, keydown_type)):
+            if event.type == quit_type:
                 pygame.quit()
                 sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+            if event.type == keydown_type:
+                if event.key == escape_key:
                     pygame.quit()
                     sys.exit()
                 if self.board.game_over:
                     continue
-                if event.key == pygame.K_LEFT:
-                    self.board.try_move(-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    self.board.try_move(1, 0)
-                elif event.key == pygame.K_DOWN:
-                    self.board.soft_drop()
-                elif event.key in (pygame.K_UP, pygame.K_x):
-                    self.board.try_rotate(1)  # CW
-                elif event.key == pygame.K_z:
-                    self.board.try_rotate(-1)  # CCW
-                elif event.key == pygame.K_SPACE:
-                    self.board.hard_drop()
-                elif event.key == pygame.K_c:
-                    self.board.hold_piece()
+                action = actions.get(event.key)
+                if action:
+                    action(self.board)
 
         # Simple DAS/ARR handling (held keys) for smooth movement
         keys = pygame.key.get_pressed()
@@ -494,12 +640,17 @@ class Game:
             return
         self.time_since_gravity += dt
         interval = self.gravity_interval()
-        while self.time_since_gravity >= interval:
+        steps = 0
+        while self.time_since_gravity >= interval and steps < MAX_GRAVITY_STEPS:
             self.time_since_gravity -= interval
+            steps += 1
             moved = self.board.try_move(0, 1)
             if not moved:
                 self.board.lock_piece()
                 break
+        # After a long stall (e.g. minimized window) drop the backlog instead of catching up
+        if self.time_since_gravity >= interval * MAX_GRAVITY_STEPS:
+            self.time_since_gravity = 0.0
 
     # ---------- Game Loop ----------
     def run(self):
@@ -509,8 +660,7 @@ class Game:
             self.handle_input(dt)
             self.update(dt)
 
-            # Draw
-            self.screen.fill(BLACK)
+            # Draw (board and panel together cover the whole window, so no full clear)
             self.render_board()
             self.render_panel()
 
@@ -520,11 +670,9 @@ class Game:
             pygame.display.flip()
 
     def draw_game_over(self):
-        overlay = pygame.Surface((COLUMNS * CELL_SIZE, ROWS * CELL_SIZE), pygame.SRCALPHA)
-        overlay.fill((20, 20, 24, 170))
-        self.screen.blit(overlay, (0, 0))
-        msg = self.font_big.render("GAME OVER", True, WHITE)
-        sub = self.font_medium.render("Press ESC to quit", True, LIGHT)
+        self.screen.blit(self._game_over_overlay, (0, 0))
+        msg = self._static_text["game_over"]
+        sub = self._static_text["quit_hint"]
         cx = (COLUMNS * CELL_SIZE) // 2
         cy = (ROWS * CELL_SIZE) // 2
         self.screen.blit(msg, (cx - msg.get_width() // 2, cy - 30))